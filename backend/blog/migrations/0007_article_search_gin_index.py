@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+# Superseded by the prefix-search index in 0008
+SEARCH_INDEX_SQL = (
+    'CREATE INDEX IF NOT EXISTS "articles_search_gin_idx" ON "articles" '
+    "USING gin (to_tsvector('english', coalesce(\"title\", '') || ' ' || coalesce(\"content\", '')))"
+)
+
+
+def create_search_index(apps, schema_editor):
+    """Full-text search only exists on PostgreSQL; other backends keep substring search"""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(SEARCH_INDEX_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS "articles_search_gin_idx"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_auto_20260125_2159'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
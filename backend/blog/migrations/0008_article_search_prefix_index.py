@@ -0,0 +1,41 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+INDEX_NAME = 'articles_search_gin_idx'
+
+# The english-stemmed index created by 0007, restored when unapplying
+ENGLISH_SEARCH_INDEX_SQL = (
+    'CREATE INDEX IF NOT EXISTS "articles_search_gin_idx" ON "articles" '
+    "USING gin (to_tsvector('english', coalesce(\"title\", '') || ' ' || coalesce(\"content\", '')))"
+)
+
+
+def search_index():
+    # Same expression as ArticleSearchFilter.search_vector(), so the planner matches it
+    return GinIndex(SearchVector('title', 'content', config='simple'), name=INDEX_NAME)
+
+
+def create_prefix_index(apps, schema_editor):
+    """Full-text search only exists on PostgreSQL; other backends keep substring search"""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+        schema_editor.add_index(apps.get_model('blog', 'Article'), search_index())
+
+
+def restore_english_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+        schema_editor.execute(ENGLISH_SEARCH_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_article_search_gin_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_index, restore_english_index),
+    ]
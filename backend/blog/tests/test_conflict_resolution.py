@@ -5,9 +5,10 @@ Property-based tests for conflict resolution
 """
 
 from django.test import TestCase
+from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
-from hypothesis import given, strategies as st, settings as hypothesis_settings
+from hypothesis import given, strategies as st, settings as hypothesis_settings, HealthCheck
 from hypothesis.extra.django import TestCase as HypothesisTestCase
 from blog.models import CustomUser, Article, Comment, Category, Tag
 import json
@@ -15,61 +16,69 @@ import string
 from datetime import timedelta
 
 
+# Status codes accepted for a comment write racing another write
+VALID_STATUS = frozenset({200, 201, 400, 409})
+
+# Printable ASCII keeps generation cheap and needs no JSON escaping
+COMMENT_ALPHABET = string.ascii_letters + string.digits + ' .,'
+
+
 class ConflictResolutionTest(HypothesisTestCase):
     """
     Property-based tests for conflict resolution mechanisms
     """
 
-    def setUp(self):
-        """Set up test environment"""
-        self.client = APIClient()
-        
-        # Clear existing data to avoid conflicts
-        CustomUser.objects.all().delete()
-        Category.objects.all().delete()
-        Article.objects.all().delete()
-        
-        # Create test users with unique identifiers
-        import uuid
-        unique_id = str(uuid.uuid4())[:8]
-        
-        self.admin_user = CustomUser.objects.create_user(
-            email=f'admin{unique_id}@example.com',
-            username=f'admin{unique_id}',
+    @classmethod
+    def setUpTestData(cls):
+        """Create users and content once for the whole class"""
+        cls.admin_user = CustomUser.objects.create_user(
+            email='admin@example.com',
+            username='admin',
             password='adminpassword123',
             user_type='admin',
             is_staff=True,
             is_superuser=True
         )
         
-        self.user1 = CustomUser.objects.create_user(
-            email=f'user1{unique_id}@example.com',
-            username=f'user1{unique_id}',
+        cls.user1 = CustomUser.objects.create_user(
+            email='user1@example.com',
+            username='user1',
             password='userpassword123',
             user_type='normal'
         )
         
         # Create test content
-        self.category = Category.objects.create(name=f'Test Category {unique_id}')
-        self.article = Article.objects.create(
-            title=f'Test Article {unique_id}',
+        cls.category = Category.objects.create(name='Test Category')
+        cls.article = Article.objects.create(
+            title='Test Article',
             content='Original content',
-            author=self.admin_user,
-            category=self.category,
+            author=cls.admin_user,
+            category=cls.category,
             status='published'
         )
+        
+        # Resolve endpoint paths once for the whole class
+        cls.articles_url = reverse('article-list')
+        cls.categories_url = reverse('category-list')
+        cls.comments_url = reverse('article-comments-list', kwargs={'article_pk': cls.article.id})
 
-    def tearDown(self):
-        """Clean up after each test"""
-        CustomUser.objects.filter(email__contains='@example.com').delete()
-        Category.objects.filter(name__startswith='Test Category').delete()
-        Article.objects.filter(title__startswith='Test Article').delete()
+    def setUp(self):
+        """Set up test environment"""
+        self.client = APIClient()
+
+    def _login_as(self, user):
+        """Authenticate the client as ``user`` without going through the token endpoint"""
+        self.client.force_authenticate(user=user)
 
     @given(
-        content1=st.text(min_size=10, max_size=200),
-        content2=st.text(min_size=10, max_size=200)
+        content1=st.text(alphabet=COMMENT_ALPHABET, min_size=10, max_size=60),
+        content2=st.text(alphabet=COMMENT_ALPHABET, min_size=10, max_size=60)
+    )
+    @hypothesis_settings(
+        max_examples=15,
+        deadline=None,
+        suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large]
     )
-    @hypothesis_settings(max_examples=50, deadline=15000)
     def test_conflict_resolution_property(self, content1, content2):
         """
         **Feature: django-postgresql-enhancement, Property 36: Conflict resolution**
@@ -79,88 +88,71 @@ class ConflictResolutionTest(HypothesisTestCase):
         and provide appropriate resolution mechanisms.
         """
         # Login user
-        login_data = {
-            'email': self.user1.email,
-            'password': 'userpassword123'
-        }
-        
-        response = self.client.post(auth/login/', login_data, format='json')
-        if response.status_code != 200:
-            return  # Skip if login fails
-        
-        access_token = response.json()['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self._login_as(self.user1)
         
         # Test sequential comment creation (simulating conflict resolution)
         comment_data1 = {'content': content1}
         comment_data2 = {'content': content2}
         
         response1 = self.client.post(
-            farticles/{self.article.id}/comments/',
+            self.comments_url,
             comment_data1,
             format='json'
         )
         
         response2 = self.client.post(
-            farticles/{self.article.id}/comments/',
+            self.comments_url,
             comment_data2,
             format='json'
         )
         
         # Both comments should be handled appropriately
-        valid_status_codes = [200, 201, 400, 409]
-        
-        self.assertIn(
-            response1.status_code,
-            valid_status_codes,
-            f"Comment creation should be handled appropriately: {response1.status_code}"
+        for i, response in enumerate((response1, response2)):
+            self.assertIn(
+                response.status_code,
+                VALID_STATUS,
+                f"Comment {i} creation should be handled appropriately: {response.status_code}"
+            )
+
+    def test_comment_readback_shape(self):
+        """
+        Property: Listed comments should carry the data needed to resolve conflicts.
+        """
+        Comment.objects.create(
+            article=self.article,
+            author=self.user1,
+            content='Readback comment',
+            approved=True
         )
         
-        self.assertIn(
-            response2.status_code,
-            valid_status_codes,
-            f"Comment creation should be handled appropriately: {response2.status_code}"
-        )
+        comments_response = self.client.get(self.comments_url)
+        self.assertEqual(comments_response.status_code, 200)
         
-        # Verify conflict resolution mechanisms are in place
-        if response1.status_code in [200, 201] and response2.status_code in [200, 201]:
-            comments_response = self.client.get(farticles/{self.article.id}/comments/')
-            
-            if comments_response.status_code == 200:
-                comments = comments_response.json()
-                
-                if isinstance(comments, list):
-                    for comment in comments:
-                        # Verify conflict resolution data is present
-                        self.assertIn('id', comment, "Comments should have unique IDs")
-                        self.assertIn('author', comment, "Comments should have author info")
-                        self.assertIn('created_at', comment, "Comments should have timestamps")
+        comments = comments_response.json()
+        self.assertEqual(len(comments), 1)
+        
+        for comment in comments:
+            # Verify conflict resolution data is present
+            self.assertIn('id', comment, "Comments should have unique IDs")
+            self.assertIn('author', comment, "Comments should have author info")
+            self.assertIn('created_at', comment, "Comments should have timestamps")
 
     def test_duplicate_prevention_conflict_resolution(self):
         """
         Property: System should prevent or handle duplicate data conflicts appropriately.
         """
         # Login as admin
-        login_data = {
-            'email': self.admin_user.email,
-            'password': 'adminpassword123'
-        }
-        
-        response = self.client.post(auth/login/', login_data, format='json')
-        self.assertEqual(response.status_code, 200)
-        
-        access_token = response.json()['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self._login_as(self.admin_user)
         
         # Try to create duplicate categories
-        category_name = f'Duplicate Test Category'
+        category_name = 'Duplicate Test Category'
         category_data = {'name': category_name}
         
         # First creation
-        response1 = self.client.post(categories/', category_data, format='json')
+        response1 = self.client.post(self.categories_url, category_data, format='json')
         
         # Second creation with same name
-        response2 = self.client.post(categories/', category_data, format='json')
+        response2 = self.client.post(self.categories_url, category_data, format='json')
         
         # System should handle duplicates appropriately
         self.assertIn(
@@ -181,16 +173,7 @@ class ConflictResolutionTest(HypothesisTestCase):
         Property: Input validation should prevent conflicts by rejecting invalid data.
         """
         # Login as admin
-        login_data = {
-            'email': self.admin_user.email,
-            'password': 'adminpassword123'
-        }
-        
-        response = self.client.post(auth/login/', login_data, format='json')
-        self.assertEqual(response.status_code, 200)
-        
-        access_token = response.json()['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self._login_as(self.admin_user)
         
         # Test invalid inputs that could cause conflicts
         invalid_article_data = {
@@ -199,7 +182,7 @@ class ConflictResolutionTest(HypothesisTestCase):
             'category_name': self.category.name
         }
         
-        response = self.client.post(articles/', invalid_article_data, format='json')
+        response = self.client.post(self.articles_url, invalid_article_data, format='json')
         
         # Invalid data should be rejected
         self.assertEqual(
@@ -218,30 +201,18 @@ class ConflictResolutionTest(HypothesisTestCase):
         Property: System state should remain consistent after operations.
         """
         # Login as user
-        login_data = {
-            'email': self.user1.email,
-            'password': 'userpassword123'
-        }
-        
-        response = self.client.post(auth/login/', login_data, format='json')
-        self.assertEqual(response.status_code, 200)
+        self._login_as(self.user1)
         
-        access_token = response.json()['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
-        
-        # Create multiple comments
+        # Create multiple comments directly; only the read path is under test
         comment_contents = ['First comment', 'Second comment']
         
-        for content in comment_contents:
-            comment_data = {'content': content}
-            self.client.post(
-                farticles/{self.article.id}/comments/',
-                comment_data,
-                format='json'
-            )
+        Comment.objects.bulk_create([
+            Comment(article=self.article, author=self.user1, content=content, approved=True)
+            for content in comment_contents
+        ])
         
         # Verify state consistency
-        comments_response = self.client.get(farticles/{self.article.id}/comments/')
+        comments_response = self.client.get(self.comments_url)
         
         if comments_response.status_code == 200:
             comments = comments_response.json()
@@ -4,38 +4,45 @@ Property-based tests for database connection monitoring
 **Validates: Requirements 5.4**
 """
 
+import itertools
 import logging
 import time
 from django.test import TestCase
 from django.db import connection, connections
 from django.core.management import call_command
 from django.conf import settings
-from hypothesis import given, strategies as st, settings as hypothesis_settings
+from django.contrib.auth.hashers import make_password
+from hypothesis import given, example, strategies as st, settings as hypothesis_settings
 from hypothesis.extra.django import TestCase as HypothesisTestCase
 from blog.models import CustomUser, Article, Category
 
+# Monotonic suffix for fixture names; unique within a test run
+_UID = itertools.count()
+
 
 class DatabaseConnectionMonitoringTest(HypothesisTestCase):
     """
     Property-based tests for database connection monitoring and data accuracy
     """
     
+    @classmethod
+    def setUpTestData(cls):
+        """Create fixtures shared by every test and Hypothesis example"""
+        # Create test data with unique identifiers to avoid conflicts
+        test_id = f'{next(_UID):08x}'
+        cls.test_user = CustomUser.objects.create_user(
+            email=f'test_{test_id}@example.com',
+            username=f'testuser_{test_id}',
+            password='testpass123'
+        )
+        cls.test_category = Category.objects.create(name=f'Test Category {test_id}')
+
     def setUp(self):
         """Set up test environment"""
         # Set up logging to capture database operations
         self.logger = logging.getLogger('django.db.backends')
         self.original_level = self.logger.level
         self.logger.setLevel(logging.DEBUG)
-        
-        # Create test data with unique identifiers to avoid conflicts
-        import uuid
-        test_id = str(uuid.uuid4())[:8]
-        self.test_user = CustomUser.objects.create_user(
-            email=f'test_{test_id}@example.com',
-            username=f'testuser_{test_id}',
-            password='testpass123'
-        )
-        self.test_category = Category.objects.create(name=f'Test Category {test_id}')
 
     def tearDown(self):
         """Clean up after tests"""
@@ -45,7 +52,9 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
         article_count=st.integers(min_value=1, max_value=10),
         query_count=st.integers(min_value=1, max_value=5)
     )
-    @hypothesis_settings(max_examples=100, deadline=5000)
+    @example(article_count=10, query_count=5)
+    @example(article_count=1, query_count=1)
+    @hypothesis_settings(max_examples=20, deadline=5000, derandomize=True)
     def test_monitoring_data_accuracy_property(self, article_count, query_count):
         """
         **Feature: django-postgresql-enhancement, Property 21: Monitoring data accuracy**
@@ -55,25 +64,29 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
         reflect the actual system behavior including connection usage, query counts, 
         and performance metrics.
         """
-        # Record initial connection state
-        initial_queries = len(connection.queries) if settings.DEBUG else 0
-        
-        # Create test articles
-        articles = []
-        for i in range(article_count):
-            article = Article.objects.create(
-                title=f'Test Article {i}',
-                content=f'Content for article {i}',
-                author=self.test_user,
-                category=self.test_category,
-                status='published'
-            )
-            articles.append(article)
+        # One bulk insert plus query_count retrievals, exactly
+        with self.assertNumQueries(1 + query_count):
+            # Create test articles in a single INSERT. bulk_create() skips save(),
+            # so slugs are set explicitly to satisfy the unique constraint; they
+            # are zero-padded so slug order is creation order.
+            articles = Article.objects.bulk_create([
+                Article(
+                    title=f'Test Article {i}',
+                    slug=f'test-article-{i:04d}',
+                    content=f'Content for article {i}',
+                    author=self.test_user,
+                    category=self.test_category,
+                    status='published'
+                ) for i in range(article_count)
+            ])
         
-        # Perform multiple queries to test monitoring accuracy
-        for _ in range(query_count):
-            # Query articles ordered by creation time to match the order they were created
-            retrieved_articles = list(Article.objects.filter(status='published').order_by('created_at'))
+            # Materialize and compare the full result set once
+            # Query articles in slug order to match the order they were created
+            retrieved_articles = list(
+                Article.objects.select_related('author', 'category')
+                .filter(status='published')
+                .order_by('slug')
+            )
             
             # Verify data accuracy - the number of retrieved articles should match created articles
             self.assertEqual(
@@ -82,28 +95,20 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
                 f"Monitoring should accurately reflect {article_count} articles were created and retrieved"
             )
             
-            # Verify each article's data integrity by comparing with the original articles
-            # Sort original articles by creation time to match retrieved order
-            sorted_articles = sorted(articles, key=lambda x: x.created_at)
-            for original, retrieved in zip(sorted_articles, retrieved_articles):
+            # Verify each article's data integrity by comparing with the original articles.
+            for original, retrieved in zip(articles, retrieved_articles):
                 self.assertEqual(original.title, retrieved.title)
                 self.assertEqual(original.content, retrieved.content)
                 self.assertEqual(original.author_id, retrieved.author_id)
                 self.assertEqual(original.category_id, retrieved.category_id)
-        
-        # Test connection monitoring accuracy
-        if settings.DEBUG:
-            final_queries = len(connection.queries)
-            query_increase = final_queries - initial_queries
             
-            # The monitoring should accurately track that queries were executed
-            # We expect at least the creation queries + retrieval queries
-            expected_minimum_queries = article_count + query_count
-            self.assertGreaterEqual(
-                query_increase,
-                expected_minimum_queries,
-                f"Query monitoring should accurately track at least {expected_minimum_queries} queries"
-            )
+            # Repeat queries only need the row count, which the database computes
+            for _ in range(query_count - 1):
+                self.assertEqual(
+                    Article.objects.filter(status='published').count(),
+                    article_count,
+                    f"Monitoring should accurately reflect {article_count} articles were created and retrieved"
+                )
         
         # Test database connection health
         self.assertTrue(
@@ -128,16 +133,16 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
         Property: For any concurrent database operations, monitoring should accurately 
         track all connections and operations without data loss or corruption.
         """
-        # Test concurrent user creation to verify monitoring accuracy under load
-        users_created = []
-        
-        for i in range(concurrent_operations):
-            user = CustomUser.objects.create_user(
+        # Test concurrent user creation to verify monitoring accuracy under load.
+        # Every user shares a password, so it is hashed once for the batch.
+        password = make_password('testpass123')
+        users_created = CustomUser.objects.bulk_create([
+            CustomUser(
                 email=f'concurrent_user_{i}@example.com',
                 username=f'concurrent_user_{i}',
-                password='testpass123'
-            )
-            users_created.append(user)
+                password=password
+            ) for i in range(concurrent_operations)
+        ])
         
         # Verify monitoring accurately tracked all user creations
         total_users = CustomUser.objects.count()
@@ -150,8 +155,9 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
         )
         
         # Verify each user was properly created and monitored
+        retrieved_users = CustomUser.objects.in_bulk([user.id for user in users_created])
         for user in users_created:
-            retrieved_user = CustomUser.objects.get(id=user.id)
+            retrieved_user = retrieved_users[user.id]
             self.assertEqual(user.email, retrieved_user.email)
             self.assertEqual(user.username, retrieved_user.username)
         
@@ -167,12 +173,13 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
         query execution times and connection metrics.
         """
         # Measure query performance
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Create a batch of articles to measure performance
         Article.objects.bulk_create([
             Article(
                 title=f'Performance Test Article {i}',
+                slug=f'performance-test-article-{i}',
                 content=f'Content for performance test {i}',
                 author=self.test_user,
                 category=self.test_category,
@@ -180,23 +187,26 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
             ) for i in range(10)
         ])
         
-        creation_time = time.time() - start_time
+        creation_time = time.perf_counter() - start_time
         
         # Query performance measurement
-        query_start_time = time.time()
-        articles = list(Article.objects.select_related('author', 'category').all())
-        query_time = time.time() - query_start_time
+        query_start_time = time.perf_counter()
+        articles = list(
+            Article.objects.select_related('author', 'category').filter(
+                author=self.test_user,
+                title__startswith='Performance Test Article'
+            )
+        )
+        query_time = time.perf_counter() - query_start_time
         
         # Verify monitoring accuracy
-        self.assertGreater(
+        self.assertEqual(
             len(articles),
-            0,
+            10,
             "Performance monitoring should accurately track that articles were created"
         )
         
-        # Performance metrics should be reasonable (not negative or extremely large)
-        self.assertGreater(creation_time, 0, "Creation time monitoring should be positive")
-        self.assertGreater(query_time, 0, "Query time monitoring should be positive")
+        # perf_counter() is monotonic, so only the upper bound needs checking
         self.assertLess(creation_time, 10, "Creation time monitoring should be reasonable")
         self.assertLess(query_time, 10, "Query time monitoring should be reasonable")
         
@@ -216,19 +226,22 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
         self.assertTrue(initial_connection_state, "Initial connection should be usable")
         
         # Perform database operations that would use connection pooling
+        created = []
         for i in range(5):
-            # Create and query data to exercise connection pooling
-            article = Article.objects.create(
+            # Create data to exercise connection pooling
+            created.append(Article.objects.create(
                 title=f'Pooling Test Article {i}',
                 content=f'Testing connection pooling {i}',
                 author=self.test_user,
                 category=self.test_category,
                 status='published'
-            )
-            
-            # Immediately query the created article
-            retrieved = Article.objects.get(id=article.id)
-            self.assertEqual(article.title, retrieved.title)
+            ))
+        
+        # Read everything back in one query rather than once per article
+        self.assertEqual(
+            Article.objects.filter(id__in=[article.id for article in created]).count(),
+            len(created)
+        )
         
         # Verify connection pooling monitoring accuracy
         final_connection_state = connection.is_usable()
@@ -239,9 +252,9 @@ class DatabaseConnectionMonitoringTest(HypothesisTestCase):
         
         # Test that connection settings are properly monitored
         db_settings = settings.DATABASES['default']
-        if 'conn_max_age' in db_settings:
+        if 'CONN_MAX_AGE' in db_settings:
             self.assertGreater(
-                db_settings['conn_max_age'],
+                db_settings['CONN_MAX_AGE'],
                 0,
                 "Connection pooling settings should be accurately monitored"
             )
\ No newline at end of file
@@ -4,78 +4,117 @@ Property-based tests for frontend state synchronization
 **Validates: Requirements 6.6**
 """
 
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.urls import reverse
 from django.utils import timezone
 from django.core.cache import cache
+from django.contrib.auth.hashers import make_password
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
-from hypothesis import given, strategies as st, settings as hypothesis_settings
+from hypothesis import given, example, strategies as st, settings as hypothesis_settings, HealthCheck, Phase
 from hypothesis.extra.django import TestCase as HypothesisTestCase
 from blog.models import CustomUser, Article, Comment, Category, Tag
-import json
+from blog.views import ArticleViewSet
 import string
+import uuid
 from datetime import timedelta
 
+# Fields the frontend relies on in each payload
+_PAGINATION_FIELDS = frozenset({'page', 'total_pages', 'count', 'page_size', 'has_next', 'has_previous'})
+_ARTICLE_FIELDS = frozenset({'id', 'title', 'slug', 'excerpt', 'author', 'category', 'created_at', 'updated_at'})
+_ARTICLE_AUTHOR_FIELDS = frozenset({'id', 'username', 'email'})
+_ARTICLE_CATEGORY_FIELDS = frozenset({'id', 'name'})
+_USER_FIELDS = frozenset({'id', 'username', 'email', 'first_name', 'last_name', 'user_type', 'is_active', 'date_joined'})
+_AUTH_FIELDS = frozenset({'access', 'refresh', 'token_type', 'expires_in', 'user'})
+_AUTH_USER_FIELDS = frozenset({'id', 'username', 'email', 'user_type'})
+_TOKEN_VALIDATION_FIELDS = frozenset({'valid', 'user', 'expires_at', 'issued_at'})
+_COMMENT_FIELDS = frozenset({'id', 'content', 'author', 'article', 'created_at', 'updated_at'})
+_COMMENT_AUTHOR_FIELDS = frozenset({'id', 'username'})
+_COMMENT_LIST_FIELDS = frozenset({'id', 'content', 'author', 'created_at'})
+_CATEGORY_FIELDS = frozenset({'id', 'name', 'article_count'})
+_TAG_FIELDS = frozenset({'id', 'name', 'article_count'})
+_SEARCH_RESULT_FIELDS = frozenset({'id', 'title', 'slug', 'excerpt', 'author', 'category'})
+_DASHBOARD_FIELDS = frozenset({'total_articles', 'total_comments', 'total_visitors', 'recent_articles', 'recent_comments'})
 
+
+def _first_and_last(items):
+    """Rows share one serializer, so checking the ends covers the shape"""
+    return items[:1] + items[-1:] if len(items) > 1 else items
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class FrontendStateSynchronizationTest(HypothesisTestCase):
     """
     Property-based tests for frontend state synchronization endpoints
     """
+    
+    # Resolved once; the property test calls the view directly
+    article_list_view = staticmethod(ArticleViewSet.as_view({'get': 'list'}))
 
-    def setUp(self):
-        """Set up test environment"""
-        self.client = APIClient()
-        
-        # Clear existing data to avoid conflicts
-        CustomUser.objects.all().delete()
-        Category.objects.all().delete()
-        Article.objects.all().delete()
-        
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Built once per class; setUpTestData attributes get deep-copied
+        # for every test, which would rebuild the client anyway
+        cls._shared_client = APIClient()
+        cls._shared_factory = APIRequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create fixtures shared by every test and Hypothesis example"""
         # Create test users with unique identifiers
-        import uuid
         unique_id = str(uuid.uuid4())[:8]
         
-        self.admin_user = CustomUser.objects.create_user(
-            email=f'admin{unique_id}@example.com',
-            username=f'admin{unique_id}',
-            password='adminpassword123',
-            user_type='admin',
-            is_staff=True,
-            is_superuser=True
-        )
-        
-        self.normal_user = CustomUser.objects.create_user(
-            email=f'user{unique_id}@example.com',
-            username=f'normaluser{unique_id}',
-            password='userpassword123',
-            user_type='normal'
-        )
+        cls.admin_user, cls.normal_user = CustomUser.objects.bulk_create([
+            CustomUser(
+                email=f'admin{unique_id}@example.com',
+                username=f'admin{unique_id}',
+                password=make_password('adminpassword123'),
+                user_type='admin',
+                is_staff=True,
+                is_superuser=True
+            ),
+            CustomUser(
+                email=f'user{unique_id}@example.com',
+                username=f'normaluser{unique_id}',
+                password=make_password('userpassword123'),
+                user_type='normal'
+            ),
+        ])
         
         # Create test content
-        self.category = Category.objects.create(name=f'Test Category {unique_id}')
-        self.article = Article.objects.create(
+        cls.category = Category.objects.create(name=f'Test Category {unique_id}')
+        cls.article = Article.objects.create(
             title=f'Test Article {unique_id}',
             content='Test content',
-            author=self.admin_user,
-            category=self.category,
+            author=cls.admin_user,
+            category=cls.category,
             status='published'
         )
 
-    def tearDown(self):
-        """Clean up after each test"""
-        # Clean up any created users
-        CustomUser.objects.filter(email__contains='@example.com').delete()
-        Category.objects.filter(name__startswith='Test Category').delete()
-        Article.objects.filter(title__startswith='Test Article').delete()
+    def setUp(self):
+        """Reuse the class client with its auth state cleared"""
+        self.client = self._shared_client
+        self.client.credentials()
+        self.client.force_authenticate(user=None)
+        self.factory = self._shared_factory
 
     @given(
         page_size=st.integers(min_value=1, max_value=100),
         page_number=st.integers(min_value=1, max_value=10)
     )
-    @hypothesis_settings(max_examples=50, deadline=10000)
+    @example(page_size=1, page_number=1)
+    @example(page_size=100, page_number=10)
+    @hypothesis_settings(
+        max_examples=10,
+        deadline=None,
+        phases=[Phase.explicit, Phase.reuse, Phase.generate],
+        suppress_health_check=[HealthCheck.too_slow]
+    )
     def test_frontend_state_synchronization_property(self, page_size, page_number):
         """
         **Feature: django-postgresql-enhancement, Property 26: Frontend state synchronization**
@@ -90,27 +129,24 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
             'page_size': page_size
         }
         
-        response = self.client.get(articles/', params)
+        # Call the view directly, skipping URL resolution, middleware and JSON
+        # decoding; response.data is the serialized payload.
+        request = self.factory.get('/articles/', params)
+        response = self.article_list_view(request)
         
         if response.status_code == 200:
-            data = response.json()
+            data = response.data
             
             # Verify response contains pagination metadata for frontend state
             if 'pagination' in data:
                 pagination = data['pagination']
                 
                 # Verify all required pagination fields are present
-                required_pagination_fields = [
-                    'page', 'total_pages', 'count', 'page_size',
-                    'has_next', 'has_previous'
-                ]
-                
-                for field in required_pagination_fields:
-                    self.assertIn(
-                        field,
-                        pagination,
-                        f"Pagination should include '{field}' for frontend state management"
-                    )
+                self.assertLessEqual(
+                    _PAGINATION_FIELDS,
+                    set(pagination),
+                    "Pagination should include every required field for frontend state management"
+                )
                 
                 # Verify pagination values are consistent
                 self.assertIsInstance(
@@ -147,78 +183,85 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
             if 'results' in data:
                 articles = data['results']
                 
-                for article in articles:
+                for article in _first_and_last(articles):
                     # Verify essential fields for frontend state
-                    essential_fields = [
-                        'id', 'title', 'slug', 'excerpt', 'author',
-                        'category', 'created_at', 'updated_at'
-                    ]
-                    
-                    for field in essential_fields:
-                        self.assertIn(
-                            field,
-                            article,
-                            f"Article should include '{field}' for frontend state"
-                        )
+                    self.assertLessEqual(
+                        _ARTICLE_FIELDS,
+                        set(article),
+                        "Article should include every required field for frontend state"
+                    )
                     
                     # Verify author data is complete
                     if 'author' in article and article['author']:
                         author = article['author']
-                        author_fields = ['id', 'username', 'email']
-                        
-                        for field in author_fields:
-                            self.assertIn(
-                                field,
-                                author,
-                                f"Author should include '{field}' for frontend state"
-                            )
+                        self.assertLessEqual(
+                            _ARTICLE_AUTHOR_FIELDS,
+                            set(author),
+                            "Author should include every required field for frontend state"
+                        )
                     
                     # Verify category data is complete
                     if 'category' in article and article['category']:
                         category = article['category']
-                        category_fields = ['id', 'name']
-                        
-                        for field in category_fields:
-                            self.assertIn(
-                                field,
-                                category,
-                                f"Category should include '{field}' for frontend state"
-                            )
+                        self.assertLessEqual(
+                            _ARTICLE_CATEGORY_FIELDS,
+                            set(category),
+                            "Category should include every required field for frontend state"
+                        )
+
+    def test_article_list_query_count_independent_of_page_size(self):
+        """
+        Property: Listing articles should issue a fixed number of queries no matter
+        how many articles are on the page.
+        """
+        Article.objects.bulk_create([
+            Article(
+                title=f'Query Count Article {i}',
+                slug=f'query-count-article-{i}',
+                content='Test content',
+                author=self.admin_user,
+                category=self.category,
+                status='published'
+            ) for i in range(10)
+        ])
+        
+        query_counts = []
+        for page_size in (1, 10):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get('/articles/', {'page_size': page_size})
+            self.assertEqual(response.status_code, 200)
+            query_counts.append(len(queries))
+        
+        self.assertEqual(
+            query_counts[0],
+            query_counts[1],
+            "Article list query count should not grow with page size"
+        )
+        self.assertLessEqual(query_counts[1], 3, "Article list should need at most 3 queries")
+        
+        # Count, page of articles, tag prefetch
+        with self.assertNumQueries(3):
+            self.client.get('/articles/', {'page_size': 10})
 
     def test_user_profile_state_synchronization(self):
         """
         Property: User profile endpoints should provide complete data for frontend state management.
         """
-        # Login as normal user
-        login_data = {
-            'email': self.normal_user.email,
-            'password': 'userpassword123'
-        }
-        
-        response = self.client.post(auth/login/', login_data, format='json')
-        self.assertEqual(response.status_code, 200)
-        
-        access_token = response.json()['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        # Authenticate as normal user; the login flow has its own test
+        self.client.force_authenticate(user=self.normal_user)
         
         # Test user profile endpoint
-        response = self.client.get(fusers/{self.normal_user.id}/')
+        response = self.client.get(f'/admin-api/users/{self.normal_user.id}/')
         
         if response.status_code == 200:
             user_data = response.json()
             
             # Verify all necessary user fields for frontend state
-            essential_user_fields = [
-                'id', 'username', 'email', 'first_name', 'last_name',
-                'user_type', 'is_active', 'date_joined'
-            ]
-            
-            for field in essential_user_fields:
-                self.assertIn(
-                    field,
-                    user_data,
-                    f"User profile should include '{field}' for frontend state"
-                )
+            self.assertLessEqual(
+                _USER_FIELDS,
+                set(user_data),
+                "User profile should include every required field for frontend state"
+            )
             
             # Verify data types are correct for frontend consumption
             self.assertIsInstance(user_data['id'], str, "User ID should be a string")
@@ -236,68 +279,48 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
             'password': 'userpassword123'
         }
         
-        response = self.client.post(auth/login/', login_data, format='json')
+        response = self.client.post('/auth/token/', login_data, format='json')
         
         if response.status_code == 200:
             auth_data = response.json()
             
             # Verify all necessary authentication fields for frontend state
-            essential_auth_fields = [
-                'access', 'refresh', 'token_type', 'expires_in', 'user'
-            ]
-            
-            for field in essential_auth_fields:
-                self.assertIn(
-                    field,
-                    auth_data,
-                    f"Authentication response should include '{field}' for frontend state"
-                )
+            self.assertLessEqual(
+                _AUTH_FIELDS,
+                set(auth_data),
+                "Authentication response should include every required field for frontend state"
+            )
             
             # Verify user data is complete in auth response
             user_data = auth_data.get('user', {})
-            user_fields = ['id', 'username', 'email', 'user_type']
-            
-            for field in user_fields:
-                self.assertIn(
-                    field,
-                    user_data,
-                    f"Authentication user data should include '{field}' for frontend state"
-                )
+            self.assertLessEqual(
+                _AUTH_USER_FIELDS,
+                set(user_data),
+                "Authentication user data should include every required field for frontend state"
+            )
             
             # Test token validation endpoint
             access_token = auth_data['access']
             self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
             
-            validation_response = self.client.get(auth/validate/')
+            validation_response = self.client.get('/auth/validate/')
             
             if validation_response.status_code == 200:
                 validation_data = validation_response.json()
                 
                 # Verify validation response includes state data
-                validation_fields = ['valid', 'user', 'expires_at', 'issued_at']
-                
-                for field in validation_fields:
-                    self.assertIn(
-                        field,
-                        validation_data,
-                        f"Token validation should include '{field}' for frontend state"
-                    )
+                self.assertLessEqual(
+                    _TOKEN_VALIDATION_FIELDS,
+                    set(validation_data),
+                    "Token validation should include every required field for frontend state"
+                )
 
     def test_comment_state_synchronization(self):
         """
         Property: Comment endpoints should provide complete data for frontend state management.
         """
-        # Login as normal user
-        login_data = {
-            'email': self.normal_user.email,
-            'password': 'userpassword123'
-        }
-        
-        response = self.client.post(auth/login/', login_data, format='json')
-        self.assertEqual(response.status_code, 200)
-        
-        access_token = response.json()['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        # Authenticate as normal user; the login flow has its own test
+        self.client.force_authenticate(user=self.normal_user)
         
         # Create a comment
         comment_data = {
@@ -305,7 +328,7 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
         }
         
         response = self.client.post(
-            farticles/{self.article.id}/comments/',
+            f'/articles/{self.article.id}/comments/',
             comment_data,
             format='json'
         )
@@ -314,54 +337,43 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
             comment_result = response.json()
             
             # Verify comment response includes all necessary fields for frontend state
-            essential_comment_fields = [
-                'id', 'content', 'author', 'article', 'created_at', 'updated_at'
-            ]
-            
-            for field in essential_comment_fields:
-                self.assertIn(
-                    field,
-                    comment_result,
-                    f"Comment should include '{field}' for frontend state"
-                )
+            self.assertLessEqual(
+                _COMMENT_FIELDS,
+                set(comment_result),
+                "Comment should include every required field for frontend state"
+            )
             
             # Verify author data is complete in comment
             if 'author' in comment_result and comment_result['author']:
                 author = comment_result['author']
-                author_fields = ['id', 'username']
-                
-                for field in author_fields:
-                    self.assertIn(
-                        field,
-                        author,
-                        f"Comment author should include '{field}' for frontend state"
-                    )
+                self.assertLessEqual(
+                    _COMMENT_AUTHOR_FIELDS,
+                    set(author),
+                    "Comment author should include every required field for frontend state"
+                )
         
         # Test comment list endpoint
-        comments_response = self.client.get(farticles/{self.article.id}/comments/')
+        comments_response = self.client.get(f'/articles/{self.article.id}/comments/')
         
         if comments_response.status_code == 200:
             comments_data = comments_response.json()
             
             # Verify comments list provides complete data
             if isinstance(comments_data, list):
-                for comment in comments_data:
+                for comment in _first_and_last(comments_data):
                     # Verify each comment has necessary fields
-                    comment_fields = ['id', 'content', 'author', 'created_at']
-                    
-                    for field in comment_fields:
-                        self.assertIn(
-                            field,
-                            comment,
-                            f"Comment list item should include '{field}' for frontend state"
-                        )
+                    self.assertLessEqual(
+                        _COMMENT_LIST_FIELDS,
+                        set(comment),
+                        "Comment list item should include every required field for frontend state"
+                    )
 
     def test_category_tag_state_synchronization(self):
         """
         Property: Category and tag endpoints should provide complete hierarchical data for frontend.
         """
         # Test categories endpoint
-        response = self.client.get(categories/')
+        response = self.client.get('/categories/')
         
         if response.status_code == 200:
             categories_data = response.json()
@@ -373,14 +385,11 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
             
             for category in categories:
                 # Verify category includes necessary fields for frontend state
-                category_fields = ['id', 'name', 'article_count']
-                
-                for field in category_fields:
-                    self.assertIn(
-                        field,
-                        category,
-                        f"Category should include '{field}' for frontend state"
-                    )
+                self.assertLessEqual(
+                    _CATEGORY_FIELDS,
+                    set(category),
+                    "Category should include every required field for frontend state"
+                )
                 
                 # Verify article count is a number
                 self.assertIsInstance(
@@ -390,7 +399,7 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
                 )
         
         # Test tags endpoint
-        response = self.client.get(tags/')
+        response = self.client.get('/tags/')
         
         if response.status_code == 200:
             tags_data = response.json()
@@ -402,14 +411,11 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
             
             for tag in tags:
                 # Verify tag includes necessary fields for frontend state
-                tag_fields = ['id', 'name', 'article_count']
-                
-                for field in tag_fields:
-                    self.assertIn(
-                        field,
-                        tag,
-                        f"Tag should include '{field}' for frontend state"
-                    )
+                self.assertLessEqual(
+                    _TAG_FIELDS,
+                    set(tag),
+                    "Tag should include every required field for frontend state"
+                )
 
     def test_search_state_synchronization(self):
         """
@@ -417,7 +423,7 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
         """
         # Test search endpoint
         search_params = {'q': 'test'}
-        response = self.client.get(articles/search/', search_params)
+        response = self.client.get('/articles/search/', search_params)
         
         if response.status_code == 200:
             search_data = response.json()
@@ -437,53 +443,33 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
                 # Verify search results include complete article data
                 results = search_data['results']
                 
-                for article in results:
+                for article in _first_and_last(results):
                     # Verify essential fields for frontend state
-                    search_result_fields = [
-                        'id', 'title', 'slug', 'excerpt', 'author', 'category'
-                    ]
-                    
-                    for field in search_result_fields:
-                        self.assertIn(
-                            field,
-                            article,
-                            f"Search result should include '{field}' for frontend state"
-                        )
+                    self.assertLessEqual(
+                        _SEARCH_RESULT_FIELDS,
+                        set(article),
+                        "Search result should include every required field for frontend state"
+                    )
 
     def test_admin_dashboard_state_synchronization(self):
         """
         Property: Admin dashboard endpoints should provide complete analytics data for frontend state.
         """
-        # Login as admin user
-        login_data = {
-            'email': self.admin_user.email,
-            'password': 'adminpassword123'
-        }
-        
-        response = self.client.post(auth/login/', login_data, format='json')
-        self.assertEqual(response.status_code, 200)
-        
-        access_token = response.json()['access']
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        # Authenticate as admin user; the login flow has its own test
+        self.client.force_authenticate(user=self.admin_user)
         
         # Test admin dashboard endpoint
-        response = self.client.get(admin/')
+        response = self.client.get('/admin-api/dashboard/')
         
         if response.status_code == 200:
             dashboard_data = response.json()
             
             # Verify dashboard includes necessary metrics for frontend state
-            dashboard_fields = [
-                'total_articles', 'total_comments', 'total_visitors',
-                'recent_articles', 'recent_comments'
-            ]
-            
-            for field in dashboard_fields:
-                self.assertIn(
-                    field,
-                    dashboard_data,
-                    f"Dashboard should include '{field}' for frontend state"
-                )
+            self.assertLessEqual(
+                _DASHBOARD_FIELDS,
+                set(dashboard_data),
+                "Dashboard should include every required field for frontend state"
+            )
             
             # Verify numeric fields are numbers
             numeric_fields = ['total_articles', 'total_comments', 'total_visitors']
@@ -503,11 +489,11 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
         # Test various error scenarios
         error_scenarios = [
             # Unauthenticated access to protected endpoint
-            {'method': 'get', 'url': admin/', 'expected_status': 401},
+            {'method': 'get', 'url': '/admin-api/dashboard/', 'expected_status': 401},
             # Invalid article ID
-            {'method': 'get', 'url': articles/invalid-id/', 'expected_status': 404},
+            {'method': 'get', 'url': '/articles/invalid-id/', 'expected_status': 404},
             # Invalid pagination (should handle gracefully)
-            {'method': 'get', 'url': articles/?page=invalid', 'expected_status': [200, 400, 404]},
+            {'method': 'get', 'url': '/articles/?page=invalid', 'expected_status': [200, 400, 404]},
         ]
         
         for scenario in error_scenarios:
@@ -528,31 +514,30 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
                     f"Error scenario {scenario['url']} should return {expected_status}"
                 )
             
-            # Verify error responses have consistent structure
-            if response.status_code >= 400 and response.content:
-                try:
-                    error_data = response.json()
-                    
-                    # Error responses should be dictionaries for frontend consumption
-                    self.assertIsInstance(
-                        error_data,
-                        dict,
-                        f"Error response for {scenario['url']} should be a dictionary"
-                    )
-                    
-                except json.JSONDecodeError:
-                    # Some error responses might not be JSON, which is acceptable
-                    pass
+            # Verify error responses have consistent structure. Only the top-level
+            # type matters, so JSON bodies are checked without being parsed; some
+            # error responses might not be JSON, which is acceptable.
+            if (
+                response.status_code >= 400
+                and response.content
+                and response.get('Content-Type', '').startswith('application/json')
+            ):
+                # Error responses should be dictionaries for frontend consumption
+                self.assertTrue(
+                    response.content.lstrip().startswith(b'{'),
+                    f"Error response for {scenario['url']} should be a dictionary"
+                )
 
-    def test_concurrent_state_consistency(self):
+    def test_repeated_request_state_consistency(self):
         """
-        Property: Concurrent requests should return consistent state data.
+        Property: Repeated requests should return consistent state data.
         """
-        # Make multiple concurrent requests to the same endpoint
+        # The test client is single-threaded, so these run back to back;
+        # two responses are enough to compare
         responses = []
         
-        for _ in range(5):
-            response = self.client.get(articles/')
+        for _ in range(2):
+            response = self.client.get('/articles/')
             if response.status_code == 200:
                 responses.append(response.json())
         
@@ -565,7 +550,7 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
                 self.assertEqual(
                     set(first_response.keys()),
                     set(response_data.keys()),
-                    "Concurrent responses should have consistent structure"
+                    "Repeated responses should have consistent structure"
                 )
                 
                 # Pagination metadata should be consistent
@@ -573,9 +558,9 @@ class FrontendStateSynchronizationTest(HypothesisTestCase):
                     first_pagination = first_response['pagination']
                     response_pagination = response_data['pagination']
                     
-                    # Count should be consistent across concurrent requests
+                    # Count should be consistent across repeated requests
                     self.assertEqual(
                         first_pagination.get('count'),
                         response_pagination.get('count'),
-                        "Pagination count should be consistent across concurrent requests"
+                        "Pagination count should be consistent across repeated requests"
                     )
\ No newline at end of file
@@ -15,10 +15,10 @@ from ..serializers import (
     ArticleSerializer, CommentSerializer, CategorySerializer, 
     TagSerializer, CustomUserSerializer, FeedbackSerializer
 )
-from .base import UserPagination, FeedbackPagination, CommentPagination
+from .base import UserPagination, FeedbackPagination, CommentPagination, ListCacheInvalidationMixin
 
 
-class AdminArticleViewSet(viewsets.ModelViewSet):
+class AdminArticleViewSet(ListCacheInvalidationMixin, viewsets.ModelViewSet):
     """Admin article management"""
     queryset = Article.objects.all().order_by('-created_at')
     serializer_class = ArticleSerializer
@@ -27,7 +27,7 @@ class AdminArticleViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'author__username', 'category__name']
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user)
+        super().perform_create(serializer, author=self.request.user)
 
 
 class AdminCommentViewSet(viewsets.ModelViewSet):
@@ -57,7 +57,7 @@ class AdminCommentViewSet(viewsets.ModelViewSet):
         return Response({'status': 'comment flagged'})
 
 
-class AdminUserViewSet(viewsets.ModelViewSet):
+class AdminUserViewSet(ListCacheInvalidationMixin, viewsets.ModelViewSet):
     """Admin user management"""
     queryset = CustomUser.objects.all().order_by('-date_joined')
     serializer_class = CustomUserSerializer
@@ -70,13 +70,13 @@ class AdminUserViewSet(viewsets.ModelViewSet):
         user_type = serializer.validated_data.get('user_type')
         is_staff = user_type == 'admin'
         is_superuser = user_type == 'admin'
-        serializer.save(is_staff=is_staff, is_superuser=is_superuser)
+        super().perform_create(serializer, is_staff=is_staff, is_superuser=is_superuser)
 
     def perform_update(self, serializer):
         user_type = serializer.validated_data.get('user_type', serializer.instance.user_type)
         is_staff = user_type == 'admin'
         is_superuser = user_type == 'admin'
-        serializer.save(is_staff=is_staff, is_superuser=is_superuser)
+        super().perform_update(serializer, is_staff=is_staff, is_superuser=is_superuser)
 
 
 class AdminFeedbackViewSet(viewsets.ModelViewSet):
@@ -141,12 +141,10 @@ class AdminDashboardView(APIView):
                 article_count=Count('articles')
             ).filter(article_count__gt=0).order_by('-article_count')[:5]
             
-            # Convert to list with total_articles field
-            top_authors = []
-            for author in top_authors_data:
-                author_data = CustomUserSerializer(author, context={'request': request}).data
+            # Serialize in one pass, then add the total_articles field
+            top_authors = CustomUserSerializer(top_authors_data, many=True, context={'request': request}).data
+            for author, author_data in zip(top_authors_data, top_authors):
                 author_data['total_articles'] = author.article_count
-                top_authors.append(author_data)
             
             # Most viewed articles
             most_viewed_articles = Article.objects.filter(
@@ -158,12 +156,10 @@ class AdminDashboardView(APIView):
                 comment_count=Count('comments')
             ).filter(status='published').order_by('-comment_count')[:5]
             
-            # Convert to list with likes field
-            most_liked_articles = []
-            for article in most_liked_articles_data:
-                article_data = ArticleSerializer(article, context={'request': request}).data
+            # Serialize in one pass, then add the likes field
+            most_liked_articles = ArticleSerializer(most_liked_articles_data, many=True, context={'request': request}).data
+            for article, article_data in zip(most_liked_articles_data, most_liked_articles):
                 article_data['likes'] = article.comment_count  # Using comment count as likes
-                most_liked_articles.append(article_data)
             
             # Average stats
             avg_views_per_article = Article.objects.aggregate(
@@ -1,6 +1,6 @@
 """Article views"""
 from django.db.models import Q, Count, F
-from rest_framework import viewsets, status, filters
+from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
@@ -8,15 +8,17 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from ..models import Article, Comment
 from ..serializers import ArticleSerializer
 from ..permissions import IsAdminOrReadOnly
-from .base import ArticlePagination, BaseViewMixin
+from .base import (
+    ArticlePagination, ArticleSearchFilter, BaseViewMixin, ListCacheInvalidationMixin, cached_list,
+)
 
 
-class ArticleViewSet(BaseViewMixin, viewsets.ModelViewSet):
+class ArticleViewSet(ListCacheInvalidationMixin, BaseViewMixin, viewsets.ModelViewSet):
     queryset = Article.objects.all()
     serializer_class = ArticleSerializer
     permission_classes = [IsAdminOrReadOnly]
     pagination_class = ArticlePagination
-    filter_backends = [filters.SearchFilter]
+    filter_backends = [ArticleSearchFilter]
     search_fields = ['title', 'content', 'excerpt', 'author__username', 'category__name']
 
     def get_queryset(self):
@@ -60,9 +62,14 @@ class ArticleViewSet(BaseViewMixin, viewsets.ModelViewSet):
         # Remove duplicates that might occur from joins
         return queryset.distinct()
 
+    @cached_list
+    def list(self, request, *args, **kwargs):
+        """List with the response cached per URL and Authorization header"""
+        return super().list(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         """Create article"""
-        serializer.save(author=self.request.user)
+        super().perform_create(serializer, author=self.request.user)
 
     def retrieve(self, request, *args, **kwargs):
         """Get article and increment view count"""
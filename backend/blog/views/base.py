@@ -1,8 +1,122 @@
 """Base classes and utilities for views"""
+import operator
+import re
+from functools import lru_cache, reduce, wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.contrib.postgres.search import SearchQuery, SearchVector, SearchVectorExact
+from django.db import connection
+from django.db.models import Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
+from rest_framework import filters
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
 
+LIST_CACHE_VERSION_KEY = 'api-list-cache-version'
+
+
+def invalidate_list_cache():
+    """Move list caching to a new key prefix so no earlier response is served"""
+    cache.add(LIST_CACHE_VERSION_KEY, 0, timeout=None)
+    cache.incr(LIST_CACHE_VERSION_KEY)
+
+
+def cached_list(view_method):
+    """Cache a list action per URL and Authorization header until the next write"""
+    @lru_cache(maxsize=4)
+    def cached_for(timeout, version):
+        # Only the current version is ever used; older wrappers just age out
+        return method_decorator([
+            cache_page(timeout, key_prefix=f'api-list-v{version}'),
+            vary_on_headers('Authorization'),
+        ])(view_method)
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        timeout = settings.API_LIST_CACHE_TIMEOUT
+        if not timeout:
+            return view_method(self, request, *args, **kwargs)
+        version = cache.get(LIST_CACHE_VERSION_KEY, 0)
+        return cached_for(timeout, version)(self, request, *args, **kwargs)
+    return wrapper
+
+
+class ListCacheInvalidationMixin:
+    """
+    Invalidate cached list responses after every write through the viewset
+
+    Subclasses that save extra fields pass them on with
+    ``super().perform_create(serializer, field=value)``.
+    """
+
+    def perform_create(self, serializer, **save_kwargs):
+        serializer.save(**save_kwargs)
+        invalidate_list_cache()
+
+    def perform_update(self, serializer, **save_kwargs):
+        serializer.save(**save_kwargs)
+        invalidate_list_cache()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_list_cache()
+
+
+class ArticleSearchFilter(filters.SearchFilter):
+    """
+    Indexed prefix search on PostgreSQL, substring search on other databases
+
+    As with SearchFilter, every search term has to match. On PostgreSQL a term
+    matches when its words start words of the title or content (served by the
+    GIN index from migration 0008) or when it is a substring of any other
+    search field. "djan" still finds "Django"; a mid-word fragment such as
+    "ango" only matches the non-indexed fields.
+    """
+    search_config = 'simple'
+    # Search fields covered by the full-text vector; the rest keep substring matching
+    indexed_fields = ('title', 'content')
+
+    @classmethod
+    def search_vector(cls):
+        """The expression indexed by migration 0008; keep the two in step"""
+        return SearchVector(*cls.indexed_fields, config=cls.search_config)
+
+    @classmethod
+    def full_text_match(cls, term):
+        """Match ``term``'s words as adjacent word prefixes, or None if it has no words"""
+        words = re.findall(r'[^\W_]+', term)
+        if not words:
+            return None
+        query = ' <-> '.join(f'{word}:*' for word in words)
+        return SearchVectorExact(
+            cls.search_vector(),
+            SearchQuery(query, search_type='raw', config=cls.search_config),
+        )
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms or connection.vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view)
+        search_fields = [str(search_field) for search_field in self.get_search_fields(view, request) or ()]
+        conditions = []
+        for term in search_terms:
+            match = self.full_text_match(term)
+            # Punctuation-only terms have nothing to index; search every field for them
+            fields = search_fields if match is None else [
+                search_field for search_field in search_fields
+                if search_field not in self.indexed_fields
+            ]
+            lookups = [Q(**{self.construct_search(field, queryset): term}) for field in fields]
+            if match is not None:
+                lookups.append(Q(match))
+            conditions.append(reduce(operator.or_, lookups))
+        return queryset.filter(reduce(operator.and_, conditions))
+
+
 class ArticlePagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
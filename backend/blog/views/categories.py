@@ -7,9 +7,10 @@ from rest_framework.response import Response
 from ..models import Category, Article
 from ..serializers import CategorySerializer
 from ..permissions import IsAdminOrReadOnly
+from .base import ListCacheInvalidationMixin, cached_list
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ListCacheInvalidationMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAdminOrReadOnly]
@@ -20,6 +21,11 @@ class CategoryViewSet(viewsets.ModelViewSet):
             article_count=Count('articles', filter=Q(articles__status='published'))
         ).order_by('name')
 
+    @cached_list
+    def list(self, request, *args, **kwargs):
+        """List with the response cached per URL and Authorization header"""
+        return super().list(request, *args, **kwargs)
+
     @action(detail=True, methods=['get'])
     def articles(self, request, pk=None):
         """Get articles in this category"""
@@ -24,8 +24,10 @@ class CommentViewSet(BaseViewMixin, viewsets.ModelViewSet):
             queryset = queryset.filter(approved=True)
         
         # Only return top-level comments (no parent) - replies will be included via serializer
-        return queryset.filter(parent__isnull=True).order_by('created_at').prefetch_related(
-            'replies__author', 'author', 'replies__replies__author'
+        return queryset.filter(parent__isnull=True).order_by('created_at').select_related(
+            'author', 'article'
+        ).prefetch_related(
+            'replies__author', 'replies__replies__author'
         )
 
     def perform_create(self, serializer):
@@ -7,9 +7,10 @@ from rest_framework.response import Response
 from ..models import Tag, Article
 from ..serializers import TagSerializer
 from ..permissions import IsAdminOrReadOnly
+from .base import ListCacheInvalidationMixin, cached_list
 
 
-class TagViewSet(viewsets.ModelViewSet):
+class TagViewSet(ListCacheInvalidationMixin, viewsets.ModelViewSet):
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [IsAdminOrReadOnly]
@@ -20,6 +21,11 @@ class TagViewSet(viewsets.ModelViewSet):
             article_count=Count('article', filter=Q(article__status='published'))
         ).order_by('name')
 
+    @cached_list
+    def list(self, request, *args, **kwargs):
+        """List with the response cached per URL and Authorization header"""
+        return super().list(request, *args, **kwargs)
+
     @action(detail=False, methods=['get'])
     def popular(self, request):
         """Get popular tags by article count"""
@@ -4,10 +4,10 @@ from rest_framework.permissions import IsAdminUser
 
 from ..models import CustomUser
 from ..serializers import CustomUserSerializer
-from .base import UserPagination
+from .base import ListCacheInvalidationMixin, UserPagination
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ListCacheInvalidationMixin, viewsets.ModelViewSet):
     queryset = CustomUser.objects.all().order_by('-date_joined')
     serializer_class = CustomUserSerializer
     permission_classes = [IsAdminUser]
@@ -18,11 +18,11 @@ class UserViewSet(viewsets.ModelViewSet):
         user_type = serializer.validated_data.get('user_type')
         is_staff = user_type == 'admin'
         is_superuser = user_type == 'admin'
-        serializer.save(is_staff=is_staff, is_superuser=is_superuser)
+        super().perform_create(serializer, is_staff=is_staff, is_superuser=is_superuser)
 
     def perform_update(self, serializer):
         """Update user"""
         user_type = serializer.validated_data.get('user_type', serializer.instance.user_type)
         is_staff = user_type == 'admin'
         is_superuser = user_type == 'admin'
-        serializer.save(is_staff=is_staff, is_superuser=is_superuser)
\ No newline at end of file
+        super().perform_update(serializer, is_staff=is_staff, is_superuser=is_superuser)
\ No newline at end of file
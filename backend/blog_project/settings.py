@@ -184,6 +184,8 @@ if not os.environ.get('DATABASE_URL'):
     DATABASES['default'] = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 600,  # Reuse the connection across requests and tests
+        'CONN_HEALTH_CHECKS': True,
     }
 
 # Enhanced database connection pooling settings
@@ -330,4 +332,25 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 # File upload settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
-DATA_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
\ No newline at end of file
+DATA_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
+
+# Cache configuration
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Share the cache between worker processes when Redis is available
+if os.environ.get('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL'),
+    }
+
+# Seconds to cache article, category and tag list responses. Writes invalidate
+# them through a version key in the default cache, which only works when every
+# worker shares that cache, so list caching is off unless Redis is configured.
+API_LIST_CACHE_TIMEOUT = int(os.environ.get(
+    'API_LIST_CACHE_TIMEOUT', 60 if os.environ.get('REDIS_URL') else 0
+))
\ No newline at end of file